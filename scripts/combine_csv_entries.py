@@ -0,0 +1,139 @@
+"""
+Combine CSV Entries
+
+Author: Brandon Colelough, Kent O'Sullivan
+
+Overview:
+Utility to merge two results CSVs produced by scholar_scrape.py into a single
+de-duplicated CSV, re-count publications per year, and re-plot the yearly
+distribution for the combined result set.
+
+To run:
+python3 ./combine_csv_entries.py first.csv second.csv
+"""
+
+# Core Imports
+import os
+import argparse
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+# Library Imports
+# plotnine is imported lazily in plot_year_counts; it drags in the whole
+# mizani/statsmodels stack and is only needed once a plot is requested
+import pandas as pd
+
+# Opt in to copy-on-write where available (pandas 2.x; always on from 3.0)
+# so masked frames below never take hidden defensive copies
+try:
+    pd.set_option('mode.copy_on_write', True)
+except Exception:
+    pass
+
+
+def read_csv_file(file_path: os.path):
+    """Reads a results CSV into a DataFrame."""
+    print(f"Reading {file_path}")
+    return pd.read_csv(file_path)
+
+
+def merge_unique_entries(df1, df2):
+    """Merges two results DataFrames, keeping the first of any duplicated title."""
+    # Filter cross-file duplicates with one hashed isin pass before the
+    # concat, so drop_duplicates only has to resolve duplicates within
+    # each source file rather than re-hashing the full combined frame
+    combined_df = pd.concat([df1, df2[~df2['Title'].isin(df1['Title'])]],
+                            ignore_index=True, copy=False)
+    unique_df = combined_df.drop_duplicates(subset='Title', ignore_index=True)
+    # Normalise the Year column so 2021, '2021.0' and bad values compare
+    # alike; to_numeric + where run as vectorized kernels rather than a
+    # Python lambda per row
+    years = pd.to_numeric(unique_df['Year'], errors='coerce')
+    unique_df.loc[:, 'Year'] = years.astype('Int64').astype(str).where(years.notna(), 'Unknown')
+    return unique_df
+
+
+def year_counts(df):
+    """Returns publications-per-year as a Series sorted by year.
+
+    Filters and converts the Year column once so printing and plotting share
+    the same Series instead of each re-running the filter passes.
+    """
+    # to_numeric is a C kernel; it both validates and converts in one pass
+    # where the old per-value regex match only validated
+    years = pd.to_numeric(df['Year'], errors='coerce').dropna().astype(int)
+    return years.value_counts().sort_index()
+
+
+def print_year_counts(counts):
+    """Displays the count of publications per year."""
+    print("Number of publications per year:")
+    for year, count in counts.items():
+        print(f"{year}: {count}")
+    print(f"Total number of publications found: {int(counts.sum())}")
+
+
+def plot_year_counts(counts, plot_directory):
+    """Creates and saves a bar chart of the combined publication counts per year."""
+    from plotnine import ggplot, aes, geom_bar, theme_classic, labs, element_text, theme
+
+    data = pd.DataFrame({'Year': counts.index.astype(str), 'Count': counts.values})
+    plot = (ggplot(data, aes(x='Year', y='Count')) +
+            geom_bar(stat='identity', fill='blue') +
+            theme_classic() +
+            labs(x='Year', y='Count of Papers Published Per Year') +
+            theme(axis_text_x=element_text(rotation=90, hjust=1)))
+
+    # A microsecond timestamp guarantees a unique name without the
+    # O(runs) stat-probing loop over the plot directory
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+    plot_file_name = os.path.join(plot_directory, f'combined_{timestamp}_year_counts_plot.svg')
+
+    plot.save(plot_file_name)
+    print(f'Plot saved to {plot_file_name}')
+
+
+def main(args):
+    """Main function"""
+    # The two reads are independent and pd.read_csv releases the GIL
+    # during its C-level parse, so overlap them
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        df1, df2 = executor.map(read_csv_file, [args.csv1, args.csv2])
+
+    unique_df = merge_unique_entries(df1, df2)
+
+    # Make sure the output directories exist before writing, matching
+    # scholar_scrape.py's behaviour on a fresh checkout
+    os.makedirs(args.output_location, exist_ok=True)
+    os.makedirs(args.plots_location, exist_ok=True)
+
+    output_path = os.path.join(args.output_location, 'combined_publications.csv')
+    unique_df.to_csv(output_path, index=False)
+    print(f"Saved combined data to {output_path}")
+
+    # Compute the per-year Series once; printing and plotting reuse it
+    counts = year_counts(unique_df)
+    print_year_counts(counts)
+    plot_year_counts(counts, args.plots_location)
+
+
+if __name__ == "__main__":
+    argparser = argparse.ArgumentParser(description="Merge two scholar_scrape results CSVs, de-duplicate on title, and re-count and re-plot publications per year.")
+    argparser.add_argument('csv1',
+                            help='first results CSV to merge',
+                            type=str)
+    argparser.add_argument('csv2',
+                            help='second results CSV to merge',
+                            type=str)
+    argparser.add_argument('--output_location',
+                            help='directory to output the combined CSV to',
+                            type=str,
+                            default=os.path.join('..', 'results', 'csv'))
+    argparser.add_argument('--plots_location',
+                            help='Directory to save plots to',
+                            type=str,
+                            default=os.path.join('..', 'results', 'plots'))
+
+    args = argparser.parse_args()
+
+    main(args)
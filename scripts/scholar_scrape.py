@@ -28,34 +28,189 @@ The above should produce ~1 result (as of 2024).
 The above should produce ~950 results (as of 2024).
 """
 
-# Core Imports 
+# Core Imports
 import re
 import os
+import csv
+import json
+import time
+import hashlib
+import itertools
+import random
 import argparse
+import functools
+import threading
+from collections import Counter
 from datetime import datetime
-from selenium.common.exceptions import TimeoutException
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 # Library Imports
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-import pandas as pd
-import matplotlib.pyplot as plt
-from plotnine import ggplot, aes, geom_bar, theme_classic, labs, element_text, theme
-import tkinter as tk
-from tkinter import Toplevel, StringVar, Entry, Radiobutton, Button
-from scholarly import scholarly
+# Selenium, pandas, matplotlib, scholarly and tkinter are all imported
+# lazily (see the _import_* helpers and the methods/branches that use
+# them) so that code paths which never need them -- --help, argument
+# errors, API-only or CLI-only runs -- do not pay their import cost.
 
 # User Imports
 
 # Selenium imports are only required in the Selenium_Scholar_Scraper class
 # to prevent errors if Selenium is not installed or needed by the user.
 
+# Compiled once at import so the per-article hot loops skip the re module's
+# pattern-cache lookup on every call. The century group is non-capturing
+# since only the full match is ever read.
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+_FOUR_DIGIT_RE = re.compile(r'\d{4}')
+
+# Strips everything but word characters and whitespace when building
+# filenames from queries.
+_SLUG_RE = re.compile(r'[^\w\s]')
+
+
+def _slugify(query: str):
+    """Reduces a query to a short, filesystem-safe filename fragment.
+
+    Uses up to the first three words of the query, strips punctuation and
+    lowercases, in a single pass shared by the CSV and plot save paths.
+    """
+    clean_query = "_".join(query.split()[:3])
+    return _SLUG_RE.sub('', clean_query).replace(' ', '_').lower()
+
+
+# Collapses titles to bare word characters when comparing across databases.
+_TITLE_KEY_RE = re.compile(r'\W+')
+
+
+def deduplicate_results(results):
+    """Drops entries whose normalised title has already been seen.
+
+    The same paper commonly appears in several databases; titles are
+    lowercased and stripped of non-word characters before comparison so
+    trivial punctuation/spacing differences still collide.
+    """
+    seen = set()
+    deduped = []
+    for title, year in results:
+        key = _TITLE_KEY_RE.sub('', title.lower())
+        if key in seen:
+            continue
+        seen.add(key)
+        deduped.append((title, year))
+    return deduped
+
+
+def _load_results_csv(csv_path: os.path):
+    """Loads (title, year) pairs back out of a previous results CSV.
+
+    When pyarrow is installed the file parses through its multithreaded
+    C++ reader with only the Title/Year columns projected; otherwise the
+    stdlib reader streams the rows, which is fine for modest files.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        with open(csv_path, newline='', encoding='utf-8') as csv_file:
+            reader = csv.reader(csv_file)
+            next(reader, None)  # skip the Title,Year header
+            return [(row[0], row[1]) for row in reader if len(row) >= 2]
+
+    # Years stay strings so cached pairs compare alike either way
+    table = pa_csv.read_csv(
+        csv_path,
+        convert_options=pa_csv.ConvertOptions(include_columns=['Title', 'Year'],
+                                              column_types={'Title': pa.string(),
+                                                            'Year': pa.string()}))
+    return list(zip(table.column('Title').to_pylist(),
+                    table.column('Year').to_pylist()))
+
+
+def _merge_resume(previous, new_pairs):
+    """Yields previous pairs, then new pairs whose title was not already saved.
+
+    A single set-keyed pass over both streams: no concat-then-
+    drop_duplicates materialisation, and memory stays at one title-key
+    set regardless of how large the accumulated CSV has grown.
+    """
+    seen = set()
+    for title, year in previous:
+        seen.add(title.casefold())
+        yield (title, year)
+    for title, year in new_pairs:
+        key = title.casefold()
+        if key in seen:
+            continue
+        seen.add(key)
+        yield (title, year)
+
+
+def _import_selenium():
+    """Imports Selenium into module scope on first use."""
+    global webdriver, By, Keys, WebDriverWait, EC, TimeoutException, NoSuchElementException
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException, NoSuchElementException
+
+
+def _import_scholarly():
+    """Imports the scholarly package into module scope on first use."""
+    global scholarly
+    from scholarly import scholarly
+
+
+class QueryCache():
+    """A small on-disk JSON cache for (title, year) search results.
+
+    Entries are keyed on scraper name + whitespace/case-normalised query
+    and expire after max_age_days, so repeating or refining a search
+    skips the whole scrape pipeline instead of re-issuing every request.
+    """
+    def __init__(self, cache_directory: os.path, max_age_days: int=7):
+        self._directory = cache_directory
+        self._max_age = max_age_days * 86400
+
+    @staticmethod
+    def normalize_query(query: str):
+        return re.sub(r'\s+', ' ', query.strip().lower())
+
+    def _entry_path(self, scraper_name: str, query: str):
+        key = hashlib.sha1(f'{scraper_name}:{self.normalize_query(query)}'.encode('utf-8')).hexdigest()
+        return os.path.join(self._directory, f'{key}.json')
+
+    def get(self, scraper_name: str, query: str):
+        """Returns the cached (title, year) list, or None on miss/expiry."""
+        path = self._entry_path(scraper_name, query)
+        try:
+            if time.time() - os.path.getmtime(path) > self._max_age:
+                return None
+            with open(path, encoding='utf-8') as cache_file:
+                return [tuple(entry) for entry in json.load(cache_file)]
+        except (OSError, ValueError):
+            return None
+
+    def put(self, scraper_name: str, query: str, results):
+        os.makedirs(self._directory, exist_ok=True)
+        with open(self._entry_path(scraper_name, query), 'w', encoding='utf-8') as cache_file:
+            json.dump(list(results), cache_file)
+
+
+def _cache_results(pairs, cache: QueryCache, scraper_name: str, query: str):
+    """Passes (title, year) pairs through unchanged, caching them once exhausted.
+
+    Lets streaming consumers like stream_results_to_csv keep their single
+    pass while still populating the on-disk cache for the next run.
+    """
+    collected = []
+    for pair in pairs:
+        collected.append(pair)
+        yield pair
+    cache.put(scraper_name, query, collected)
+
+
 # Classes for different types of scholar scraping
 class Selenium_Scholar_Scraper():
     """
@@ -66,39 +221,92 @@ class Selenium_Scholar_Scraper():
         plot_directory (str): Path where plots will be saved.
         wait_time (int): How long Selenium will wait for a page to load before timing out.
     """
-    def __init__(self, output_directory: os.path, plot_directory: os.path, wait_time: int=100):
+    RESULTS_PER_PAGE = 10
+    # Scholar serves at most ~1000 results per query regardless of the
+    # advertised total, so there is no point fanning out past that.
+    MAX_RESULTS = 1000
+
+    def __init__(self, output_directory: os.path, plot_directory: os.path, wait_time: int=20, max_workers: int=4, driver=None, headless: bool=True):
         #self._output_directory = self.ensure_directory_exists(output_directory)
         #self._plot_directory = self.ensure_directory_exists(plot_directory)
-        chrome_install = ChromeDriverManager().install()
-
-        folder = os.path.dirname(chrome_install)
-        chromedriver_path = os.path.join(folder, "chromedriver.exe")
-        self._service = ChromeService(chromedriver_path)
-        #self._service = ChromeService(ChromeDriverManager().install())
-        self._driver = webdriver.Chrome(service=self._service)
-        self._wait = WebDriverWait(self._driver, wait_time)
+        _import_selenium()
+        self._headless = headless
+        # Persisting the profile keeps Scholar cookies (and any solved
+        # CAPTCHA) across runs, so later sessions warm-start instead of
+        # arriving as a brand-new browser
+        self._profile_directory = os.path.join(output_directory, '.selenium_profile')
+        if driver is not None:
+            # Reuse a caller-supplied driver so browser start-up is paid
+            # once and amortised across queries
+            self._driver = driver
+        else:
+            # Selenium Manager (built into Selenium 4.6+) resolves and
+            # caches the matching chromedriver itself, so no
+            # webdriver-manager install/version check is needed
+            self._driver = webdriver.Chrome(
+                options=self._chrome_options(headless, user_data_dir=self._profile_directory))
+        # 100ms polling instead of the 500ms default shaves up to 0.4s
+        # off every wait; 20s is plenty — if Scholar has not answered by
+        # then the session has almost certainly been CAPTCHA'd
+        self._wait = WebDriverWait(self._driver, wait_time, poll_frequency=0.1)
+        self._wait_time = wait_time
+        self._max_workers = max_workers
+        # One driver per pool thread, created on first use and reused
+        # across offsets; the registry lets close() quit them all
+        self._thread_local = threading.local()
+        self._worker_drivers = []
         self.open_google_scholar()
 
+    def _chrome_options(self, headless: bool=True, user_data_dir: str=None):
+        """Builds page-load-optimised Chrome options.
+
+        Only the .gs_rt/.gs_a text is scraped, so images and stylesheets
+        are disabled and the 'eager' load strategy returns control at
+        DOMContentLoaded rather than waiting for every subresource.
+        Pass headless=False when a visible browser is needed (e.g. to
+        solve a CAPTCHA by hand). user_data_dir points the main driver at
+        a persistent profile; parallel workers must leave it unset, since
+        Chrome refuses to share one profile between live instances.
+        """
+        options = webdriver.ChromeOptions()
+        if headless:
+            options.add_argument('--headless=new')
+        if user_data_dir is not None:
+            options.add_argument(f'--user-data-dir={os.path.abspath(user_data_dir)}')
+            # A sized disk cache next to the profile lets repeat runs
+            # reuse Scholar's JS bundles and TLS session state instead of
+            # re-downloading and re-handshaking on every invocation
+            options.add_argument(f'--disk-cache-dir={os.path.abspath(user_data_dir)}_httpcache')
+            options.add_argument('--disk-cache-size=134217728')  # 128 MiB
+        options.add_argument('--disable-gpu')
+        options.add_argument('--no-sandbox')
+        # Belt and braces with the prefs below: the Blink switch stops
+        # image fetches even where the content-settings pref is ignored
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.default_content_setting_values.stylesheets': 2,
+            'profile.managed_default_content_settings.fonts': 2,
+        })
+        options.page_load_strategy = 'eager'
+        return options
+
     def open_google_scholar(self):
         """Navigates to the Google Scholar homepage."""
         self._driver.get('https://scholar.google.com/')
 
-    def format_search_query(self, query:str):
-        "formats search query as a string"
-        return query
-    
     def get_query_box(self):
         return self._driver.find_element(By.NAME,'q')
 
     def send_query(self, query:str):
-        """Submits a search query to Google Scholar using Selenium."""
-        search_box = self.get_query_box()
+        """Submits a search query to Google Scholar by navigating straight to the results URL.
+
+        Loading scholar?q=... directly replaces the find-the-box, type, submit
+        sequence (three WebDriver round-trips plus the homepage render) with a
+        single navigation, and works regardless of which page the driver is on.
+        """
         print(f'Querying Google Scholar with: {query}')
-        search_box.send_keys(query)
-        search_box.send_keys(Keys.RETURN)
-        #if not self.wait_for_responses():
-        #    print("Failed to load results in time. Please try again with a different query or check your network.")
-        #    return []
+        self._driver.get(f'https://scholar.google.com/scholar?q={quote(query)}')
 
     def send_query_and_adjust_settings(self, query: str):
         """Submits a search query to Google Scholar and adjusts settings like unchecking the 'Include citations' checkbox."""
@@ -155,70 +363,48 @@ class Selenium_Scholar_Scraper():
     def wait_for_responses(self):
         """Waits for the search results page to load and verifies its presence."""
         try:
-            print(f"Waiting {self._wait._timeout} seconds for a response")    
+            print(f"Waiting {self._wait._timeout} seconds for a response")
             results_container_present = self._wait.until(EC.presence_of_element_located((By.ID, 'gs_res_ccl_mid')))
             if not results_container_present:
                 self._driver.quit()
                 exit("The results container did not load in time.")
             return True
-        except:
+        except TimeoutException:
+            # Distinguish being throttled from a slow network: Google
+            # redirects CAPTCHA'd sessions to a /sorry/ page
+            if '/sorry/' in self._driver.current_url:
+                print("Google Scholar has served a CAPTCHA page; this session is being throttled.")
+            return False
+        except Exception:
             return False
         
-    def extract_results(self, query: str):
+    # Collects every result row in one JavaScript execution. Each row comes
+    # back as [title, byline, is_citation], so a page costs a single
+    # WebDriver round-trip instead of one HTTP call per element per field.
+    _EXTRACT_RESULTS_JS = (
+        "return Array.from(document.querySelectorAll('#gs_res_ccl_mid .gs_ri'))"
+        ".map(function(r) {"
+        " var t = r.querySelector('.gs_rt');"
+        " var a = r.querySelector('.gs_a');"
+        " return [t ? t.innerText : '',"
+        "         a ? a.innerText : '',"
+        "         !!r.querySelector('span.gs_ctu span.gs_ct1')]; });"
+    )
+
+    def extract_results(self, query: str, seen=None):
+        """Yields (title, year) pairs page by page, clicking through 'Next' links.
+
+        A seen set of casefolded titles (e.g. from a resume CSV) makes
+        already-saved entries drop out as they are scraped.
+        """
         print('Extracting Results...')
-        results = []
         page_number = 1
         has_next_page = True
-        search_terms = [term.lower() for term in query.replace('"', '').split(' OR ')]
 
         while has_next_page:
-            print(f"Processing page: {page_number}")              
-            articles = self._driver.find_elements(By.CSS_SELECTOR, '.gs_rt')
-            years = self._driver.find_elements(By.CSS_SELECTOR, '.gs_a')
-            all_valid_data = []  # This will store tuples of (title, year)
-
-            # List to hold articles and years without citations
-            valid_articles = []
-            valid_years = []
-
-            for article, year in zip(articles, years):
-            # Check if citation is present in the parent element of the title
-                #parent_element = article.find_element(By.XPATH, '..')  # Get the parent div of the h3.gs_rt
-                citation_present = article.find_elements(By.CSS_SELECTOR, 'span.gs_ctu span.gs_ct1')
-
-                # If citation is present and matches '[CITATION]', skip processing this article
-                if citation_present and '[CITATION]' in citation_present[0].text:
-                    continue
-
-                # For some reason not working and is causing issues now? 
-                #article_text = article.text.lower()
-                #if not any(term in article_text for term in search_terms):
-                #    continue
-
-                year_text = year.text
-                # Attempt to extract the year after the last comma
-                parts = year_text.split(', ')
-                possible_year = parts[-1] if parts else 'Unknown'
-                
-                # Validate that the extracted part is a four-digit year
-                if re.match(r'\d{4}', possible_year):
-                    year = possible_year
-                    year_match = re.search(r'\b(19|20)\d{2}\b', year)
-                    year = year_match.group()
-                else:
-                    year = 'Unknown'  # Default to 'Unknown' if the format does not match
-
-                valid_articles.append(article.text)  # Store the article title
-                valid_years.append(year)  # Store the extracted year
-                all_valid_data.append((article.text, year))  # Add the valid data to list
-            
-            # Process only valid articles and years
-            results.extend([(title, year) for title, year in all_valid_data])
-
-            #Process only valid articles and years
-            #if valid_articles and valid_years:
-            #   results.extend(self.process_page(valid_articles, valid_years))
-               
+            print(f"Processing page: {page_number}")
+            rows = self._driver.execute_script(self._EXTRACT_RESULTS_JS)
+            yield from self.process_page(rows, seen)
 
             # Check if there is a next page
             try:
@@ -228,66 +414,285 @@ class Selenium_Scholar_Scraper():
                 # Wait for the next page to load
                 self._wait.until(EC.presence_of_element_located((By.ID, 'gs_res_ccl_mid')))
                 page_number += 1
-            except Exception as e:
+            except (NoSuchElementException, TimeoutException):
+                # Only a missing 'Next' link (or the page never loading)
+                # means the end of the results; anything else should surface
                 print(f"No more pages. Stopping at page {page_number}")
                 has_next_page = False
 
+    def get_total_results(self):
+        """Reads the 'About N results' banner to size the page fan-out."""
+        try:
+            banner = self._driver.find_element(By.CSS_SELECTOR, '#gs_ab_md .gs_ab_mdw').text
+            match = re.search(r'([\d,.]+)\s+results?', banner)
+            if match:
+                return int(re.sub(r'[,.]', '', match.group(1)))
+        except Exception:
+            pass
+        return None
+
+    def _worker_driver(self):
+        """Returns the calling worker thread's driver, creating it on first use.
+
+        Browser start-up is paid once per pool thread rather than once
+        per page; close() quits every driver in the registry. Workers are
+        always headless; only the primary driver is ever shown for manual
+        CAPTCHA solving.
+        """
+        driver = getattr(self._thread_local, 'driver', None)
+        if driver is None:
+            driver = webdriver.Chrome(options=self._chrome_options(headless=True))
+            self._thread_local.driver = driver
+            self._worker_drivers.append(driver)
+        return driver
+
+    def _scrape_offset(self, query: str, start: int, seen=None):
+        """Fetches and processes a single results page at the given start offset.
+
+        Runs in a worker thread with a per-thread driver so page loads
+        overlap instead of waiting on one browser walking 'Next' links.
+        """
+        # Random jitter in 100ms increments so the workers do not hit
+        # Scholar in one synchronised burst and trip rate limiting.
+        time.sleep(random.randint(1, 5) * 0.1)
+        driver = self._worker_driver()
+        try:
+            driver.get(f'https://scholar.google.com/scholar?start={start}&q={quote(query)}')
+            WebDriverWait(driver, self._wait_time, poll_frequency=0.1).until(
+                EC.presence_of_element_located((By.ID, 'gs_res_ccl_mid')))
+            rows = driver.execute_script(self._EXTRACT_RESULTS_JS)
+        except TimeoutException:
+            # Throttling surfaces as a timeout in whichever worker drew
+            # the short straw; keep the pages that did load rather than
+            # letting one offset abort the whole run
+            print(f"Timed out fetching results at offset {start}; skipping this page")
+            return []
+        return list(self.process_page(rows, seen))
+
+    def extract_results_parallel(self, query: str, seen=None):
+        """Yields (title, year) pairs by fanning a worker pool out over start offsets.
+
+        The already-loaded first page supplies the total result count, from
+        which the remaining page offsets are computed and scraped
+        concurrently. Falls back to the sequential 'Next'-walking loop when
+        the result count cannot be read. An optional seen set of casefolded
+        titles filters already-saved entries at the source.
+        """
+        total = self.get_total_results()
+        if total is None:
+            yield from self.extract_results(query, seen)
+            return
+
+        print(f'Extracting Results ({total} reported)...')
+        yield from self.process_page(self._driver.execute_script(self._EXTRACT_RESULTS_JS), seen)
+
+        offsets = range(self.RESULTS_PER_PAGE, min(total, self.MAX_RESULTS), self.RESULTS_PER_PAGE)
+        if offsets:
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                for page_results in executor.map(lambda start: self._scrape_offset(query, start, seen), offsets):
+                    yield from page_results
+
+    def close(self):
+        """Shuts the browsers down once the caller is finished with all queries.
+
+        Drivers are no longer quit after each extraction, so Chrome
+        start-ups are amortised across every query of a CLI session.
+        """
+        for driver in self._worker_drivers:
+            driver.quit()
+        self._worker_drivers.clear()
         self._driver.quit()
-        with open('valid_articles_and_years.txt', 'w', encoding='utf-8') as file:
-            for title, year in all_valid_data:
-                file.write(f"{title}, {year}\n")
-        return results
 
     def check_next_page(self, page_number):
         """Checks and navigates to the next page of results if available."""
         try:
-            next_button = self._driver.find_element(self.By.LINK_TEXT, 'Next')
+            next_button = self._driver.find_element(By.LINK_TEXT, 'Next')
             next_button.click()
-            self._wait.until(self.EC.presence_of_element_located((self.By.ID, 'gs_res_ccl_mid')))
+            self._wait.until(EC.presence_of_element_located((By.ID, 'gs_res_ccl_mid')))
             return True, page_number + 1
-        except:
+        except (NoSuchElementException, TimeoutException):
             print(f"No more pages. Stopping at page {page_number}")
             return False, page_number
 
-    def process_page(self, articles, years):
-        """Processes each article and year element found on the current page."""
-        page_results = []
-        for article, year in zip(articles, years):
-            title = article.text
-            year_text = year.text
-            # Bug fix! 
-            # Skip citations and invalid years
-            if "[CITATION]" in title or "N/A" in year_text:
+    def process_page(self, rows, seen=None):
+        """Yields (title, year) for the [title, byline, is_citation] rows of one page.
+
+        When a seen set is supplied, titles already in it (casefolded)
+        are skipped and new ones added, so resumed runs prune duplicates
+        during scraping rather than in a post-hoc dedup pass.
+        """
+        for title, byline, is_citation in rows:
+            # Skip citation-only entries; they carry no retrievable document
+            if is_citation or "[CITATION]" in title:
                 continue
-            year_match = re.search(r'\b(19|20)\d{2}\b', year_text)
-            if year_match:
-                pub_year = year_match.group()
-                page_results.append((title, pub_year))
-        return page_results
+
+            if seen is not None:
+                key = title.casefold()
+                # set.add/membership hold the GIL, so sharing one set
+                # across the offset workers is safe
+                if key in seen:
+                    continue
+                seen.add(key)
+
+            # Attempt to extract the year after the last comma
+            parts = byline.split(', ')
+            possible_year = parts[-1] if parts else 'Unknown'
+
+            # Validate that the extracted part is a four-digit year; the
+            # century check can still miss (e.g. an 18xx year), so fall
+            # back to 'Unknown' rather than assuming a match
+            year_match = _YEAR_RE.search(possible_year) if _FOUR_DIGIT_RE.match(possible_year) else None
+            pub_year = year_match.group() if year_match else 'Unknown'
+
+            yield (title, pub_year)
 
 class Scholarly_Scholar_Scraper():
     """
     A class for scraping publication data from Google Scholar using the scholarly package.
-    
+
     Attributes:
-        None specific.
+        cache (QueryCache): Optional disk cache consulted before scraping.
     """
-    def search_publications(self, query:str):
-        """Uses the scholarly package to fetch publications based on a query."""
-        search_query = scholarly.search_pubs(query)
-        results = []
+    PAGE_SIZE = 10
+    PREFETCH_WORKERS = 4
+
+    def __init__(self, cache: QueryCache=None):
+        _import_scholarly()
+        self._cache = cache
+
+    def _fetch_page(self, query: str, start_index: int):
+        """Fetches one page of PAGE_SIZE results starting at the given index."""
+        page = []
         try:
-            while True:
-                pub = next(search_query)
+            search_query = scholarly.search_pubs(query, start_index=start_index)
+            for pub in itertools.islice(search_query, self.PAGE_SIZE):
                 pub_year = pub['bib'].get('pub_year', 'No year')
                 title = pub['bib'].get('title', 'No title')
-                year_match = re.search(r'\b(19|20)\d{2}\b', pub_year)
+                year_match = _YEAR_RE.search(pub_year)
                 if year_match:
                     pub_year = year_match.group()
-                results.append((title, pub_year))
-        except StopIteration:
-            pass
-        return results
+                page.append((title, pub_year))
+        except Exception as e:
+            print(f"Failed to fetch results from index {start_index}: {e}")
+        return page
+
+    def search_publications(self, query:str):
+        """Yields (title, year) publication pairs fetched via the scholarly package.
+
+        Pages are prefetched in parallel rounds of PREFETCH_WORKERS via
+        start_index offsets instead of pulling results one next() (one
+        HTTP fetch) at a time; the round after a short page is the last.
+        Pairs stream to the caller as each round completes, so downstream
+        CSV writing and counting overlap with the remaining fetches, and
+        the collected list is written back to the cache at the end.
+        """
+        if self._cache is not None:
+            cached = self._cache.get(type(self).__name__, query)
+            if cached is not None:
+                print('Using cached results for this query')
+                yield from cached
+                return
+
+        collected = []
+        seen_titles = set()
+        start_index = 0
+        with ThreadPoolExecutor(max_workers=self.PREFETCH_WORKERS) as executor:
+            while True:
+                offsets = range(start_index,
+                                start_index + self.PAGE_SIZE * self.PREFETCH_WORKERS,
+                                self.PAGE_SIZE)
+                pages = list(executor.map(lambda start: self._fetch_page(query, start), offsets))
+                last_round = False
+                for page in pages:
+                    for title, pub_year in page:
+                        # Overlapping offsets can repeat entries; keep the first
+                        if title in seen_titles:
+                            continue
+                        seen_titles.add(title)
+                        collected.append((title, pub_year))
+                        yield (title, pub_year)
+                    if len(page) < self.PAGE_SIZE:
+                        last_round = True
+                if last_round:
+                    break
+                start_index = offsets.stop
+
+        if self._cache is not None:
+            self._cache.put(type(self).__name__, query, collected)
+
+class SerpAPI_Scholar_Scraper():
+    """
+    A class for fetching publication data from Google Scholar via the SerpAPI HTTP API.
+
+    An HTTP-only alternative to the Selenium scraper: no Chrome startup,
+    no CAPTCHA handling, just paged JSON responses over a pooled session.
+
+    Attributes:
+        api_key (str): SerpAPI key; falls back to the SERPAPI_KEY environment variable.
+        cache (QueryCache): Optional disk cache consulted before fetching.
+    """
+    SEARCH_URL = 'https://serpapi.com/search.json'
+    PAGE_SIZE = 20
+
+    def __init__(self, api_key: str=None, cache: QueryCache=None):
+        import requests
+        self._api_key = api_key or os.environ.get('SERPAPI_KEY')
+        if not self._api_key:
+            raise ValueError('A SerpAPI key is required (pass api_key or set SERPAPI_KEY)')
+        self._cache = cache
+        # One pooled session keeps the TLS connection alive across pages,
+        # so each page after the first skips the handshake entirely
+        self._session = requests.Session()
+        self._session.mount('https://', requests.adapters.HTTPAdapter(pool_connections=10,
+                                                                      pool_maxsize=20))
+
+    def _fetch_page(self, query: str, start: int):
+        """Fetches one page of results starting at the given offset."""
+        response = self._session.get(self.SEARCH_URL,
+                                     params={'engine': 'google_scholar',
+                                             'q': query,
+                                             'start': start,
+                                             'num': self.PAGE_SIZE,
+                                             'api_key': self._api_key},
+                                     timeout=(3, 30))
+        response.raise_for_status()
+        page = []
+        for result in response.json().get('organic_results', []):
+            title = result.get('title', 'No title')
+            summary = result.get('publication_info', {}).get('summary', '')
+            year_match = _YEAR_RE.search(summary)
+            page.append((title, year_match.group() if year_match else 'Unknown'))
+        return page
+
+    def search_publications(self, query: str):
+        """Yields (title, year) publication pairs fetched via SerpAPI.
+
+        Pages stream to the caller as they arrive; a short page ends the
+        walk, and the collected list is written back to the cache.
+        """
+        if self._cache is not None:
+            cached = self._cache.get(type(self).__name__, query)
+            if cached is not None:
+                print('Using cached results for this query')
+                yield from cached
+                return
+
+        collected = []
+        start = 0
+        while True:
+            page = self._fetch_page(query, start)
+            collected.extend(page)
+            yield from page
+            if len(page) < self.PAGE_SIZE:
+                break
+            start += self.PAGE_SIZE
+
+        if self._cache is not None:
+            self._cache.put(type(self).__name__, query, collected)
+
+    def close(self):
+        """Closes the pooled HTTP session."""
+        self._session.close()
 
 # Placeholder classes for other databases
 class IEEE_Scraper:
@@ -341,83 +746,137 @@ class DisplayResults():
     def count_publications_by_year(self, results):
         """Counts publications per year from the provided results."""
         print("Counting publications by year...")
-        year_count = {}
-        for _, pub_year in results:
-            if pub_year in year_count:
-                year_count[pub_year] += 1
-            else:
-                year_count[pub_year] = 1
-        return year_count
+        return Counter(pub_year for _, pub_year in results)
+
+    @staticmethod
+    def _sorted_year_counts(year_count):
+        """Returns parallel (years, counts) lists sorted by year.
+
+        One sort shared by the display and plot paths, so neither
+        re-derives the ordering from the dict on its own.
+        """
+        items = sorted(year_count.items())
+        return [year for year, _ in items], [count for _, count in items]
 
     def display_year_counts(self, year_count):
         """Displays the count of publications per year."""
-        total_publications = sum(year_count.values())
+        years, counts = self._sorted_year_counts(year_count)
         print("Number of publications per year:")
-        for year in sorted(year_count.keys()):
-            print(f"{year}: {year_count[year]}")
-        print(f"Total number of publications found: {total_publications}")
-
-    def save_results_to_csv(self, data, query, file_name_prefix='publications_data'):
-        """Saves the provided data to a CSV file, naming the file based on the query."""
-        # Extract words from the query and create a filename part
-        query_parts = query.split()
-        num_words_to_use = min(3, len(query_parts))  # Use up to three words or fewer if not available
-        clean_query = "_".join(query_parts[:num_words_to_use])  # Join words
-
-        # Clean the filename part by removing non-alphanumeric characters except underscores
-        clean_query = re.sub(r'[^\w\s]', '', clean_query).lower()  # Clean up to use as a filename
-
-        # Create a base file name
-        base_file_name = f"{file_name_prefix}_{clean_query}.csv"
-
-        # Ensure the file name is unique
-        final_file_name = base_file_name
-        count = 1
-        while os.path.exists(os.path.join(self.output_directory, final_file_name)):
-            final_file_name = f"{file_name_prefix}_{clean_query}_{count}.csv"
-            count += 1
-
-        # Save the CSV file
-        file_path = os.path.join(self.output_directory, final_file_name)
-        data.to_csv(file_path, index=False)
+        for year, count in zip(years, counts):
+            print(f"{year}: {count}")
+        print(f"Total number of publications found: {sum(counts)}")
+
+    def _results_csv_path(self, query, file_name_prefix='publications_data'):
+        """Builds a unique CSV path inside the output directory, named from the query."""
+        clean_query = _slugify(query)
+
+        # A microsecond timestamp guarantees a unique name without the
+        # O(runs) stat-probing loop over the output directory
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+        return os.path.join(self.output_directory, f"{file_name_prefix}_{clean_query}_{timestamp}.csv")
+
+    def save_results_to_csv(self, results, query, file_name_prefix='publications_data'):
+        """Saves (title, year) results to a CSV file, naming the file based on the query."""
+        if not results:
+            print("No results to save; skipping CSV output.")
+            return
+        file_path = self._results_csv_path(query, file_name_prefix)
+        with open(file_path, 'w', newline='', encoding='utf-8') as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(['Title', 'Year'])
+            writer.writerows(results)
+        print(f"Saved data to {file_path}")
+
+    def stream_results_to_csv(self, results, query, file_name_prefix='publications_data'):
+        """Streams (title, year) results to CSV, counting years along the way.
+
+        Consumes the results iterable exactly once, so scrapers can yield
+        lazily and the full result list is never held in memory. Returns
+        the per-year Counter for display and plotting.
+        """
+        file_path = self._results_csv_path(query, file_name_prefix)
+        year_count = Counter()
+        with open(file_path, 'w', newline='', encoding='utf-8') as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(['Title', 'Year'])
+            for title, year in results:
+                writer.writerow([title, year])
+                year_count[year] += 1
         print(f"Saved data to {file_path}")
+        return year_count
 
     def plot_year_counts(self, year_count, query):
         """Creates and saves a bar chart of publication counts per year using the query to name the file."""
-        # Extract words from the query and create a filename base
-        query_parts = query.split()
-        num_words_to_use = min(3, len(query_parts))  # Use up to three words or fewer if not available
-        clean_query = "_".join(query_parts[:num_words_to_use])  # Join words
-
-        # Clean the filename base by removing non-alphanumeric characters except underscores
-        clean_query = re.sub(r'[^\w\s]', '', clean_query).replace(' ', '_').lower()
-
-        # Filter out entries with "Unknown" as the year
-        filtered_year_count = {year: count for year, count in year_count.items() if year != 'Unknown'}
-
-
-        # Create a DataFrame for plotting
-        data = pd.DataFrame(list(filtered_year_count.items()), columns=['Year', 'Count'])
-        plot = (ggplot(data, aes(x='Year', y='Count')) +
-                geom_bar(stat='identity', fill='blue') +
-                theme_classic() +
-                labs(x='Year', y='Count of Papers Published Per Year') +
-                theme(axis_text_x=element_text(rotation=90, hjust=1)))
-
-        # Generate a unique filename by checking existing files
-        plot_file_name = os.path.join(self.plot_directory, f'{clean_query}_year_counts_plot.svg')
-        counter = 1
-        while os.path.exists(plot_file_name):
-            plot_file_name = os.path.join(self.plot_directory, f'{clean_query}_{counter}_year_counts_plot.svg')
-            counter += 1
-
-        # Save the plot
-        plot.save(plot_file_name)
+        # Keep only keys that parse as years; scrapers emit sentinels
+        # like 'Unknown' and 'No year' for undated results
+        filtered_year_count = {}
+        for year, count in year_count.items():
+            try:
+                filtered_year_count[int(year)] = count
+            except (TypeError, ValueError):
+                continue
+
+        # Bail out before touching pandas/matplotlib when there is nothing
+        # to draw; this also avoids reindexing over an empty year range
+        if not filtered_year_count:
+            print("No dated publications to plot; skipping plot output.")
+            return
+
+        import numpy as np
+        import matplotlib
+        # The figure only ever goes to an SVG file; Agg skips the Tk/Qt
+        # event-loop setup an interactive backend would pay on first use
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+
+        clean_query = _slugify(query)
+
+        # Build the contiguous year axis directly as fixed-width numpy
+        # arrays (int16 covers any publication year, int32 any count);
+        # this zero-fills the gap years without the pandas Series/
+        # DataFrame detour the old reindex path went through
+        years_sorted, counts_sorted = self._sorted_year_counts(filtered_year_count)
+        first_year, last_year = years_sorted[0], years_sorted[-1]
+        years = np.arange(first_year, last_year + 1, dtype=np.int16)
+        counts = np.zeros(years.shape, dtype=np.int32)
+        counts[np.asarray(years_sorted) - first_year] = counts_sorted
+
+        # Plain matplotlib bar chart; the plotnine grammar-of-graphics
+        # pipeline was overkill for this and dominated plot time
+        fig, ax = plt.subplots(figsize=(10, 6))
+        ax.bar(years.astype(str), counts, color='blue')
+        ax.set_xlabel('Year')
+        ax.set_ylabel('Count of Papers Published Per Year')
+        ax.tick_params(axis='x', rotation=90)
+        fig.tight_layout()
+
+        # A microsecond timestamp guarantees a unique name without the
+        # O(runs) stat-probing loop over the plot directory
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+        plot_file_name = os.path.join(self.plot_directory, f'{clean_query}_{timestamp}_year_counts_plot.svg')
+
+        # Save the plot. A fixed hash salt and no embedded date keep the
+        # SVG bytewise reproducible across runs, so identical results
+        # produce identical files
+        plt.rcParams['svg.hashsalt'] = 'scholar_scrape'
+        fig.savefig(plot_file_name, format='svg', metadata={'Date': None})
+        plt.close(fig)
         print(f'Plot saved to {plot_file_name}')
 
 
+# Default output locations, joined once at import instead of inside the
+# argparse defaults on every invocation
+_DEFAULT_CSV_DIR = os.path.join('..', 'results', 'csv')
+_DEFAULT_PLOTS_DIR = os.path.join('..', 'results', 'plots')
+
+
+@functools.lru_cache(maxsize=None)
 def ensure_directory_exists(directory:os.path):
-        """Ensures output directories exist"""
+        """Ensures output directories exist.
+
+        Memoised so repeated calls for the same path (CSV and plot dirs
+        often coincide) skip the stat/makedirs syscalls.
+        """
         if not os.path.exists(directory):
             print(f"Target Directory not Found, making new Directory at {directory}")
             os.makedirs(directory)
@@ -426,85 +885,163 @@ def ensure_directory_exists(directory:os.path):
 
         return directory
 
+def _run_gui(args, display, query_cache):
+    """Runs the Tk multi-database GUI mode."""
+    import tkinter as tk
+    from tkinter import StringVar, IntVar, Entry, Checkbutton, Button
+
+    root = tk.Tk()
+    root.title("Scholarly Database Search")
+
+    query_var = StringVar()
+    entry = Entry(root, textvariable=query_var, width=50)
+    entry.pack()
+
+    databases = {'Scholarly': Scholarly_Scholar_Scraper(cache=query_cache),
+                'IEEE': IEEE_Scraper(),
+                'arXiv': ArXiv_Scraper(),
+                'ACM': ACM_Scraper(),
+                'Springer': Springer_Scraper(),
+                'Semantic Scholar': SemanticScholar_Scraper(),
+                'PubMed': PubMed_Scraper()}
+
+    database_vars = {db: IntVar(value=1) for db in databases}
+    for db, var in database_vars.items():
+        Checkbutton(root, text=db, variable=var).pack()
+
+    def on_submit():
+        query = query_var.get()
+        selected = {db: scraper for db, scraper in databases.items()
+                    if database_vars[db].get()}
+        results = []
+        # Each provider call is independent network I/O, so query them
+        # concurrently and collect results as they complete; total
+        # latency becomes the slowest provider rather than the sum
+        if selected:
+            with ThreadPoolExecutor(max_workers=len(selected)) as executor:
+                # list() wrapping keeps generator-based scrapers doing
+                # their fetching inside the worker thread
+                futures = {executor.submit(lambda s=scraper: list(s.search_publications(query))): db
+                           for db, scraper in selected.items()}
+                for future in as_completed(futures):
+                    results.extend(future.result())
+        # The same paper can come back from several databases; keep
+        # one copy so the counts and plot are not inflated
+        results = deduplicate_results(results)
+        year_count = display.count_publications_by_year(results)
+        display.display_year_counts(year_count)
+        display.save_results_to_csv(results, query)
+        display.plot_year_counts(year_count, query)
+        root.destroy()
+
+    submit_button = Button(root, text="Submit", command=on_submit)
+    submit_button.pack()
+    root.mainloop()
+
+
+def _query_api(args, display, query_cache, sss, query):
+    """Runs one streaming query against an API-backed scraper (scholarly/SerpAPI)."""
+    # Single pass, mirroring the Selenium path: pairs stream into the
+    # CSV while the per-year counts accumulate
+    results = sss.search_publications(query)
+    if args.resume_from_csv:
+        results = _merge_resume(_load_results_csv(args.resume_from_csv), results)
+    return display.stream_results_to_csv(results, query)
+
+
+def _query_web(args, display, query_cache, sss, query):
+    """Runs one query through the Selenium scraper, with caching and resume."""
+    # Kick the prior-CSV parse off in the background so the disk read
+    # overlaps with Scholar navigation and the results wait instead of
+    # running after them
+    resume_future = None
+    if args.resume_from_csv:
+        resume_executor = ThreadPoolExecutor(max_workers=1)
+        resume_future = resume_executor.submit(_load_results_csv, args.resume_from_csv)
+        resume_executor.shutdown(wait=False)
+
+    # Repeat queries are served from the on-disk cache without touching
+    # Scholar at all — every avoided request matters when throttling is
+    # in play
+    cached = query_cache.get('selenium', query)
+    previous = None
+    if cached is not None:
+        results = iter(cached)
+        if resume_future is not None:
+            previous = resume_future.result()
+    else:
+        sss.send_query(query=query)
+        if sss.wait_for_responses():
+            # Seed extraction with the already-saved titles so resumed
+            # runs drop duplicates as they are scraped instead of in a
+            # post-hoc pass
+            seen = None
+            if resume_future is not None:
+                previous = resume_future.result()
+                seen = {title.casefold() for title, _ in previous}
+            #sss.uncheck_include_citations()  # Uncheck the checkbox after results load
+            results = sss.extract_results_parallel(query, seen=seen)
+        else:
+            quit(f'Unable to Retrieve results for {query}, try again or try a simpler query')
+        # Only cache unpruned scrapes: a seen-filtered stream omits every
+        # title already in the resume CSV, and caching it would serve
+        # that incomplete set to later runs of the same query
+        if seen is None:
+            results = _cache_results(results, query_cache, 'selenium', query)
+
+    # Interrupted runs (throttle, CAPTCHA) can be resumed: prior entries
+    # are re-emitted first and new ones deduped against them, so the
+    # output CSV holds the union
+    if previous is not None:
+        results = _merge_resume(previous, results)
+
+    # Single pass: results stream straight into the CSV while the
+    # per-year counts accumulate
+    return display.stream_results_to_csv(results, query)
+
+
+def _run_cli(args, display, query_cache, data_source):
+    """Runs the interactive CLI loop with the backend resolved once up front."""
+    if data_source == 'serpapi':
+        sss = SerpAPI_Scholar_Scraper(cache=query_cache)
+        run_query = _query_api
+    elif data_source == 'scholar_API':
+        sss = Scholarly_Scholar_Scraper(cache=query_cache)  # Default scraper for CLI for simplicity
+        run_query = _query_api
+    else:
+        sss = Selenium_Scholar_Scraper(output_directory=args.results_location,
+                                        plot_directory=args.plots_location,
+                                        wait_time=args.wait_time)
+        run_query = _query_web
+
+    while True:
+        query = input("Enter your search query for Scholarly Databases (type 'exit' to quit): ")
+        if query.lower() == 'exit':
+            break
+
+        year_count = run_query(args, display, query_cache, sss, query)
+        display.display_year_counts(year_count)
+        display.plot_year_counts(year_count, query)
+
+    if data_source != 'scholar_API':
+        sss.close()
+
+
 def main(args):
-    """Main function"""
-    data_source = 'scholar_API' if args.scholar_API else 'scholar_Web'
+    """Main function: resolves the mode and backend once, then dispatches."""
+    if args.serpapi:
+        data_source = 'serpapi'
+    elif args.scholar_API:
+        data_source = 'scholar_API'
+    else:
+        data_source = 'scholar_Web'
     display = DisplayResults(args.results_location, args.plots_location)
+    query_cache = QueryCache(os.path.join(args.results_location, '.cache'))
 
     if args.GUI:
-        # GUI mode
-        root = tk.Tk()
-        root.title("Scholarly Database Search")
-
-        query_var = StringVar()
-        entry = Entry(root, textvariable=query_var, width=50)
-        entry.pack()
-
-        databases = {'Scholarly': Scholarly_Scholar_Scraper(),
-                    'IEEE': IEEE_Scraper(),
-                    'arXiv': ArXiv_Scraper(),
-                    'ACM': ACM_Scraper(),
-                    'Springer': Springer_Scraper(),
-                    'Semantic Scholar': SemanticScholar_Scraper(),
-                    'PubMed': PubMed_Scraper()}
-
-        database_vars = {db: IntVar(value=1) for db in databases}
-        for db, var in database_vars.items():
-            Checkbutton(root, text=db, variable=var).pack()
-
-        def on_submit():
-            query = query_var.get()
-            results = []
-            for db, scraper in databases.items():
-                if database_vars[db].get():
-                    results.extend(scraper.search_publications(query))
-            year_count = display.count_publications_by_year(results)
-            display.display_year_counts(year_count)
-            display.save_results_to_csv(pd.DataFrame(results, columns=['Title', 'Year']), query)
-            display.plot_year_counts(year_count, query)
-            root.destroy()
-
-        submit_button = Button(root, text="Submit", command=on_submit)
-        submit_button.pack()
-        root.mainloop()
-
+        _run_gui(args, display, query_cache)
     elif args.CLI:
-        if data_source == 'scholar_API':
-            sss = Scholarly_Scholar_Scraper()  # Default scraper for CLI for simplicity
-        else:
-            sss = Selenium_Scholar_Scraper(output_directory=args.results_location,
-                                            plot_directory=args.plots_location,
-                                            wait_time=args.wait_time)
-        # CLI mode
-        while True:
-            query = input("Enter your search query for Scholarly Databases (type 'exit' to quit): ")
-            if query.lower() == 'exit':
-                break
-            
-            # this if statement is some hamburger ass code but It'll be fixed when the rest of the database scrapers are implemented
-            # TODO - fix this 
-            if data_source == 'scholar_API':
-                results = sss.search_publications(query)
-                year_count = display.count_publications_by_year(results)
-                display.display_year_counts(year_count)
-                display.save_results_to_csv(pd.DataFrame(results, columns=['Title', 'Year']), query)
-                display.plot_year_counts(year_count, query)
-            else:
-                now = datetime.now()
-                tn = now.strftime('%y%b%d-%H:%M:%S').upper()
-
-                query = sss.format_search_query(query=query)
-                sss.send_query(query=query)
-                if sss.wait_for_responses():
-                    #sss.uncheck_include_citations()  # Uncheck the checkbox after results load
-                    results = sss.extract_results(query)
-                else:
-                    quit(f'Unable to Retrieve results for {query}, try again or try a simpler query')
-
-                year_count = display.count_publications_by_year(results)
-                display.display_year_counts(year_count)
-                display.save_results_to_csv(pd.DataFrame(results, columns=['Title', 'Year']), query)
-                display.plot_year_counts(year_count, query)
+        _run_cli(args, display, query_cache, data_source)
     else:
         print("No valid mode selected. Please use --GUI or --CLI.")
 
@@ -520,11 +1057,11 @@ if __name__ == "__main__":
     argparser.add_argument('--results_location', 
                             help='directory to output the results CSV to', 
                             type=str, 
-                            default=os.path.join('..', 'results', 'csv'))
+                            default=_DEFAULT_CSV_DIR)
     argparser.add_argument('--plots_location', 
                             help='Directory to save plots to', 
                             type=str, 
-                            default=os.path.join('..', 'results', 'plots'))
+                            default=_DEFAULT_PLOTS_DIR)
     argparser.add_argument('--wait_time', 
                             help='how long selenium should wait before abandoning the search', 
                             type=int, 
@@ -532,9 +1069,16 @@ if __name__ == "__main__":
     argparser.add_argument('--scholar_API', 
                             action='store_true', 
                             help='Use scholarly API for data retrieval.')
-    argparser.add_argument('--scholar_Web', 
-                            action='store_true', 
+    argparser.add_argument('--scholar_Web',
+                            action='store_true',
                             help='Use Selenium for data retrieval.')
+    argparser.add_argument('--serpapi',
+                            action='store_true',
+                            help='Use the SerpAPI HTTP API for data retrieval (requires SERPAPI_KEY).')
+    argparser.add_argument('--resume_from_csv',
+                            help='previous results CSV to resume from; its entries are kept and new results are deduplicated against them',
+                            type=str,
+                            default=None)
 
     args = argparser.parse_args()
     